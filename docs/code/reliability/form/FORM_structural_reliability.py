@@ -27,7 +27,7 @@ according to:
 
 import numpy as np
 import matplotlib.pyplot as plt
-plt.style.use('ggplot')
+from scipy.stats import norm
 from UQpy.distributions import Normal
 from UQpy.reliability import FORM
 from UQpy.run_model.RunModel import RunModel
@@ -80,51 +80,30 @@ print('FORM record of the function gradient:', form.state_function_gradient_reco
 
 # %%
 
-def multivariate_gaussian(pos, mu, sigma):
-    """Supporting function"""
-    n = mu.shape[0]
-    sigma_det = np.linalg.det(sigma)
-    sigma_inv = np.linalg.inv(sigma)
-    N = np.sqrt((2 * np.pi) ** n * sigma_det)
-    fac = np.einsum('...k,kl,...l->...', pos - mu, sigma_inv, pos - mu)
-    return np.exp(-fac / 2) / N
-
-
 N = 60
-XX = np.linspace(150, 250, N)
-YX = np.linspace(120, 180, N)
-XX, YX = np.meshgrid(XX, YX)
+xx = np.linspace(150, 250, N)
+yx = np.linspace(120, 180, N)
 
-XU = np.linspace(-3, 3, N)
-YU = np.linspace(-3, 3, N)
-XU, YU = np.meshgrid(XU, YU)
+# The U-space grid is square and centered, so a single axis vector serves both directions
+uu = np.linspace(-3, 3, N)
 
 
 # %% md
 #
-# Define the mean vector and covariance matrix in the original :math:`\textbf{X}` space and the standard normal
-# :math:`\textbf{U}` space.
+# Define the means and standard deviations in the original :math:`\textbf{X}` space and the standard normal
+# :math:`\textbf{U}` space. Since :math:`R` and :math:`S` are independent, the joint probability density factorizes
+# into a product of two univariate normal densities, which is evaluated as an outer product of the two
+# one-dimensional grids.
 
 # %%
-mu_X = np.array([distribution_resistance.parameters['loc'], distribution_stress.parameters['loc']])
-sigma_X = np.array([[distribution_resistance.parameters['scale']**2, 0],
-                    [0, distribution_stress.parameters['scale']**2]])
-
-mu_U = np.array([0, 0])
-sigma_U = np.array([[1, 0],
-                    [0, 1]])
-
-# Pack X and Y into a single 3-dimensional array for the original space
-posX = np.empty(XX.shape + (2,))
-posX[:, :, 0] = XX
-posX[:, :, 1] = YX
-ZX = multivariate_gaussian(posX, mu_X, sigma_X)
-
-# Pack X and Y into a single 3-dimensional array for the standard normal space
-posU = np.empty(XU.shape + (2,))
-posU[:, :, 0] = XU
-posU[:, :, 1] = YU
-ZU = multivariate_gaussian(posU, mu_U, sigma_U)
+mu_R = distribution_resistance.parameters['loc']
+sigma_R = distribution_resistance.parameters['scale']
+mu_S = distribution_stress.parameters['loc']
+sigma_S = distribution_stress.parameters['scale']
+
+ZX = np.multiply.outer(norm.pdf(yx, mu_S, sigma_S), norm.pdf(xx, mu_R, sigma_R))
+pdf_u = norm.pdf(uu)
+ZU = np.multiply.outer(pdf_u, pdf_u)
 
 # %% md
 #
@@ -132,32 +111,36 @@ ZU = multivariate_gaussian(posU, mu_U, sigma_U)
 # space.
 
 # %%
-fig, ax = plt.subplots()
-ax.contour(XX, YX, ZX,
-           levels=20)
-ax.plot([0, 200], [0, 200],
-        color='black', linewidth=2, label='$G(R,S)=R-S=0$', zorder=1)
-ax.scatter(mu_X[0], mu_X[1],
-           color='black', s=64, label='Mean $(\mu_R, \mu_S)$')
-ax.scatter(form.design_point_x[0][0], form.design_point_x[0][1],
-           color='tab:orange', marker='*', s=100, label='Design Point', zorder=2)
-ax.set(xlabel='Resistence $R$', ylabel='Stress $S$', xlim=(145, 255), ylim=(115, 185))
-ax.set_title('Original $X$ Space ')
-ax.set_aspect('equal')
-ax.legend(loc='lower right')
-
-fig, ax = plt.subplots()
-ax.contour(XU, YU, ZU,
-           levels=20, zorder=1)
-ax.plot([0, -3], [5, -1],
-        color='black', linewidth=2, label='$G(U_1, U_2)=0$', zorder=2)
-ax.arrow(0, 0, form.design_point_u[0][0], form.design_point_u[0][1],
-         color='tab:blue', length_includes_head=True, width=0.05, label='$\\beta=||u^*||$', zorder=2)
-ax.scatter(form.design_point_u[0][0], form.design_point_u[0][1],
-           color='tab:orange', marker='*', s=100, label='Design Point $u^*$', zorder=2)
-ax.set(xlabel='$U_1$', ylabel='$U_2$', xlim=(-3, 3), ylim=(-3, 3))
-ax.set_aspect('equal')
-ax.set_title('Standard Normal $U$ Space')
-ax.legend(loc='lower right')
+def plot_pdf_contour(x, y, Z, design_point, design_point_label, xlabel, ylabel, title, xlim, ylim):
+    """Supporting function"""
+    fig, ax = plt.subplots()
+    ax.contour(x, y, Z,
+               levels=20, zorder=1)
+    ax.scatter(design_point[0], design_point[1],
+               color='tab:orange', marker='*', s=100, label=design_point_label, zorder=2)
+    ax.set(xlabel=xlabel, ylabel=ylabel, xlim=xlim, ylim=ylim)
+    ax.set_title(title)
+    ax.set_aspect('equal')
+    return fig, ax
+
+
+with plt.style.context('ggplot'):
+    fig, ax = plot_pdf_contour(xx, yx, ZX, form.design_point_x[0], 'Design Point',
+                               xlabel='Resistence $R$', ylabel='Stress $S$',
+                               title='Original $X$ Space ', xlim=(145, 255), ylim=(115, 185))
+    ax.plot([0, 200], [0, 200],
+            color='black', linewidth=2, label='$G(R,S)=R-S=0$', zorder=1)
+    ax.scatter(mu_R, mu_S,
+               color='black', s=64, label='Mean $(\mu_R, \mu_S)$')
+    ax.legend(loc='lower right')
+
+    fig, ax = plot_pdf_contour(uu, uu, ZU, form.design_point_u[0], 'Design Point $u^*$',
+                               xlabel='$U_1$', ylabel='$U_2$',
+                               title='Standard Normal $U$ Space', xlim=(-3, 3), ylim=(-3, 3))
+    ax.plot([0, -3], [5, -1],
+            color='black', linewidth=2, label='$G(U_1, U_2)=0$', zorder=2)
+    ax.arrow(0, 0, form.design_point_u[0][0], form.design_point_u[0][1],
+             color='tab:blue', length_includes_head=True, width=0.05, label='$\\beta=||u^*||$', zorder=2)
+    ax.legend(loc='lower right')
 
 plt.show()
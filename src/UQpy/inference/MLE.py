@@ -101,17 +101,20 @@ class MLE:
             self._run_optimization(self.initial_parameters, self.n_optimizations)
 
     def _run_distribution_fit(self, n_optimizations):
-        for _ in range(n_optimizations):
-            self.inference_model.distributions.update_parameters(
-                **{key: None for key in self.inference_model.list_params})
-            mle_dict = self.inference_model.distributions.fit(data=self.data)
-            mle_tmp = np.array([mle_dict[key] for key in self.inference_model.list_params])
-            max_log_like_tmp = self.inference_model.evaluate_log_likelihood(
-                parameters=mle_tmp[np.newaxis, :], data=self.data)[0]
-            # Save result
-            if self.mle is None or max_log_like_tmp > self.max_log_like:
-                self.mle = mle_tmp
-                self.max_log_like = max_log_like_tmp
+        # The distribution's fit method is deterministic given the data, so repeated
+        # restarts would all return the same estimate; a single evaluation suffices.
+        if n_optimizations < 1:
+            return
+        self.inference_model.distributions.update_parameters(
+            **{key: None for key in self.inference_model.list_params})
+        mle_dict = self.inference_model.distributions.fit(data=self.data)
+        mle_tmp = np.array([mle_dict[key] for key in self.inference_model.list_params])
+        max_log_like_tmp = self.inference_model.evaluate_log_likelihood(
+            parameters=mle_tmp[np.newaxis, :], data=self.data)[0]
+        # Save result
+        if self.mle is None or max_log_like_tmp > self.max_log_like:
+            self.mle = mle_tmp
+            self.max_log_like = max_log_like_tmp
 
     def _run_optimization(self, initial_parameters, n_optimizations):
         if initial_parameters is None:
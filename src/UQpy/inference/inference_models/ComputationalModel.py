@@ -56,9 +56,12 @@ class ComputationalModel(InferenceModel):
         # Case 1.a: Gaussian error model
         if self.log_likelihood is None:
             if isinstance(self.error_covariance, (float, int)):
+                # iid Gaussian errors: evaluate the log pdf over the whole residual
+                # vector in one call instead of once per data point
                 norm = Normal(loc=0.0, scale=np.sqrt(self.error_covariance))
+                data_array = np.asarray(data)
                 log_like_values = np.array(
-                    [np.sum([norm.log_pdf(data_i - outpt_i) for data_i, outpt_i in zip(data, output)])
+                    [np.sum(norm.log_pdf(data_array - np.asarray(output)))
                      for output in model_outputs])
             else:
                 multivariate_normal = MultivariateNormal(data, cov=self.error_covariance)
@@ -47,9 +47,9 @@ class DistributionModel(InferenceModel):
                 self.prior.log_pdf = lambda x: np.log(self.prior.pdf(x))
 
     def evaluate_log_likelihood(self, parameters, data):
-        log_like_values = []
-        for params_ in parameters:
-            self.distributions.update_parameters(**dict(zip(self.list_params, params_)))
-            log_like_values.append(np.sum(self.distributions.log_pdf(x=data)))
-        log_like_values = np.array(log_like_values)
+        list_params = self.list_params
+        log_like_values = np.empty(len(parameters))
+        for i, params_ in enumerate(parameters):
+            self.distributions.update_parameters(**dict(zip(list_params, params_)))
+            log_like_values[i] = np.sum(self.distributions.log_pdf(x=data))
         return log_like_values
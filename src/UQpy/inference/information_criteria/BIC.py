@@ -1,5 +1,6 @@
+import math
+
 from UQpy.inference.information_criteria.baseclass.InformationCriterion import InformationCriterion
-import numpy as np
 from UQpy.inference import MLE
 from UQpy.utilities.ValidationTypes import NumpyFloatArray
 
@@ -21,4 +22,4 @@ class BIC(InformationCriterion):
         return -2 * max_log_like + penalty_term
 
     def _calculate_penalty_term(self, n_data, n_parameters):
-        return np.log(n_data) * n_parameters
+        return math.log(n_data) * n_parameters
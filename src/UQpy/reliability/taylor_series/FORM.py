@@ -193,9 +193,8 @@ class FORM(TaylorSeries):
             self.x = x
             self.u_record.append(u)
             self.x_record.append(x)
-            self.logger.info("Design point Y: {0}\n".format(u[k, :])
-                             + "Design point X: {0}\n".format(self.x)
-                             + "Jacobian Jzx: {0}\n".format(self.jacobian_zx))
+            self.logger.info("Design point Y: %s\nDesign point X: %s\nJacobian Jzx: %s\n",
+                             u[k, :], self.x, self.jacobian_zx)
 
             # 2. evaluate Limit State Function and the gradient at point u_k and direction cosines
             state_function_gradient, qoi, _ = self._derivatives(point_u=u[k, :],
@@ -208,14 +207,14 @@ class FORM(TaylorSeries):
             state_function_gradient_record[k + 1, :] = state_function_gradient
             norm_of_state_function_gradient = np.linalg.norm(state_function_gradient)
             alpha = state_function_gradient / norm_of_state_function_gradient
-            self.logger.info("Directional cosines (alpha): {0}\n".format(alpha)
-                             + "State Function Gradient: {0}\n".format(state_function_gradient)
-                             + "Norm of State Function Gradient: {0}\n".format(norm_of_state_function_gradient))
+            self.logger.info("Directional cosines (alpha): %s\nState Function Gradient: %s\n"
+                             "Norm of State Function Gradient: %s\n",
+                             alpha, state_function_gradient, norm_of_state_function_gradient)
             self.alpha = alpha.squeeze()
             self.alpha_record.append(self.alpha)
             beta[k] = -np.inner(u[k, :].T, self.alpha)
             beta[k + 1] = beta[k] + qoi / norm_of_state_function_gradient
-            self.logger.info("Beta: {0}\n".format(beta[k]) + "Pf: {0}".format(stats.norm.cdf(-beta[k])))
+            self.logger.info("Beta: %s\nPf: %s", beta[k], stats.norm.cdf(-beta[k]))
 
             u[k + 1, :] = -beta[k + 1] * self.alpha
 
@@ -235,8 +234,8 @@ class FORM(TaylorSeries):
             self.logger.info("Error: %s", self.error_record[-1])
 
         if k > self.n_iterations:
-            self.logger.info("UQpy: Maximum number of iterations {0} was reached before convergence."
-                             .format(self.n_iterations))
+            self.logger.info("UQpy: Maximum number of iterations %s was reached before convergence.",
+                             self.n_iterations)
         else:
             self.design_point_u.append(u[k, :])
             self.design_point_x.append(np.squeeze(self.x))
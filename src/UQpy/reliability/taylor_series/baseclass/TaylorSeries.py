@@ -32,23 +32,17 @@ class TaylorSeries(ABC):
             x_0 = temp_x_0
             list_of_samples.append(x_0)
 
-        for ii in range(point_u.shape[0]):
-            y_i1_j = point_u.tolist()
-            y_i1_j[ii] = y_i1_j[ii] + df_step
-
-            z_i1_j = Correlate(np.array(y_i1_j).reshape(1, -1), nataf_object.corr_z).samples_z
-            nataf_object.run(samples_z=z_i1_j.reshape(1, -1), jacobian=False)
-            temp_x_i1_j = nataf_object.samples_x
-            x_i1_j = temp_x_i1_j
-            list_of_samples.append(x_i1_j)
-
-            y_1i_j = point_u.tolist()
-            y_1i_j[ii] = y_1i_j[ii] - df_step
-            z_1i_j = Correlate(np.array(y_1i_j).reshape(1, -1), nataf_object.corr_z).samples_z
-            nataf_object.run(samples_z=z_1i_j.reshape(1, -1), jacobian=False)
-            temp_x_1i_j = nataf_object.samples_x
-            x_1i_j = temp_x_1i_j
-            list_of_samples.append(x_1i_j)
+        # Build all finite difference points in one batch and transform them with a
+        # single Correlate/Nataf call instead of one transform per perturbed point.
+        dimension = point_u.shape[0]
+        points_u = np.tile(np.asarray(point_u, dtype=float), (2 * dimension, 1))
+        for ii in range(dimension):
+            points_u[2 * ii, ii] += df_step
+            points_u[2 * ii + 1, ii] -= df_step
+        z = Correlate(points_u, nataf_object.corr_z).samples_z
+        nataf_object.run(samples_z=z, jacobian=False)
+        for x_fd in nataf_object.samples_x:
+            list_of_samples.append(x_fd.reshape(1, -1))
 
         array_of_samples = np.array(list_of_samples)
         array_of_samples = array_of_samples.reshape((len(array_of_samples), -1))
@@ -56,8 +50,8 @@ class TaylorSeries(ABC):
         runmodel_object.run(samples=array_of_samples, append_samples=False)
         y1 = runmodel_object.qoi_list
         logging.getLogger(__name__).info(
-            "samples to evaluate the model: {0}".format(array_of_samples)
-            + "model evaluations: {0}".format(runmodel_object.qoi_list))
+            "samples to evaluate the model: %smodel evaluations: %s",
+            array_of_samples, runmodel_object.qoi_list)
 
         if order.lower() == "first":
             gradient = np.zeros(point_u.shape[0])
@@ -137,8 +131,8 @@ class TaylorSeries(ABC):
             runmodel_object.run(samples=array_of_mixed_points, append_samples=False)
 
             logging.getLogger(__name__).info(
-                "samples for gradient: {0}".format(array_of_mixed_points[1:])
-                + "model evaluations for the gradient: {0}".format(runmodel_object.qoi_list[1:]))
+                "samples for gradient: %smodel evaluations for the gradient: %s",
+                array_of_mixed_points[1:], runmodel_object.qoi_list[1:])
 
             for j in range(count):
                 qoi_0 = runmodel_object.qoi_list[4 * j]
@@ -1,7 +1,14 @@
 import numpy as np
 
+domain = np.linspace(0, 10, 50)
+
 def model_linear(theta):
-    domain = np.linspace(0, 10, 50)
     # this one takes one parameter vector theta and return one qoi
     inpt = np.array(theta).reshape((-1,))
     return inpt[0] * domain
+
+
+def model_linear_vectorized(theta):
+    # this one takes several parameter vectors theta - vectorized computations to return appropriate qois
+    inpts = np.atleast_2d(theta)
+    return inpts[:, [0]] * domain
@@ -4,19 +4,29 @@ from UQpy.distributions.collection import Gamma, Exponential, ChiSquare
 from UQpy.inference.inference_models.DistributionModel import DistributionModel
 from UQpy.inference.InformationModelSelection import InformationModelSelection
 
+# Seeds shared by all criteria tests; the asserted values below are tied to these
+# streams, so every estimator draws from the same state rather than each test
+# hard-coding its own.
+data_random_state = 12
+mle_random_state = 0
 
-def test_aic():
-    data = Gamma(a=2, loc=0, scale=2).rvs(nsamples=500, random_state=12)
+# Reference dataset shared by all criteria tests; rvs with a fixed random_state is
+# deterministic and the data is never modified, so it is generated only once.
+data = Gamma(a=2, loc=0, scale=2).rvs(nsamples=500, random_state=data_random_state)
+
+# Candidate models shared by all criteria tests. Each MLE run resets the learnable
+# parameters to None before fitting, so the models can be reused across tests
+# without affecting the estimates.
+m0 = DistributionModel(distributions=Gamma(a=None, loc=None, scale=None), n_parameters=3, name='gamma')
+m1 = DistributionModel(distributions=Exponential(loc=None, scale=None), n_parameters=2, name='exponential')
+m2 = DistributionModel(distributions=ChiSquare(df=None, loc=None, scale=None),
+                       n_parameters=3, name='chi-square')
 
-    m0 = DistributionModel(distributions=Gamma(a=None, loc=None, scale=None), n_parameters=3, name='gamma')
-    m1 = DistributionModel(distributions=Exponential(loc=None, scale=None), n_parameters=2, name='exponential')
-    m2 = DistributionModel(distributions=ChiSquare(df=None, loc=None, scale=None),
-                           n_parameters=3, name='chi-square')
 
-    candidate_models = [m0, m1, m2]
-    mle1 = MLE(inference_model=m0, random_state=0, data=data)
-    mle2 = MLE(inference_model=m1, random_state=0, data=data)
-    mle3 = MLE(inference_model=m2, random_state=0, data=data)
+def test_aic():
+    mle1 = MLE(inference_model=m0, random_state=mle_random_state, data=data)
+    mle2 = MLE(inference_model=m1, random_state=mle_random_state, data=data)
+    mle3 = MLE(inference_model=m2, random_state=mle_random_state, data=data)
     selector = InformationModelSelection(parameter_estimators=[mle1, mle2, mle3], criterion=AIC(),
                                          n_optimizations=[5]*3)
     selector.sort_models()
@@ -26,16 +36,9 @@ def test_aic():
 
 
 def test_bic():
-    data = Gamma(a=2, loc=0, scale=2).rvs(nsamples=500, random_state=12)
-    m0 = DistributionModel(distributions=Gamma(a=None, loc=None, scale=None), n_parameters=3, name='gamma')
-    m1 = DistributionModel(distributions=Exponential(loc=None, scale=None), n_parameters=2, name='exponential')
-    m2 = DistributionModel(distributions=ChiSquare(df=None, loc=None, scale=None),
-                           n_parameters=3, name='chi-square')
-
-    candidate_models = [m0, m1, m2]
-    mle1 = MLE(inference_model=m0, random_state=0, data=data)
-    mle2 = MLE(inference_model=m1, random_state=0, data=data)
-    mle3 = MLE(inference_model=m2, random_state=0, data=data)
+    mle1 = MLE(inference_model=m0, random_state=mle_random_state, data=data)
+    mle2 = MLE(inference_model=m1, random_state=mle_random_state, data=data)
+    mle3 = MLE(inference_model=m2, random_state=mle_random_state, data=data)
     selector = InformationModelSelection(parameter_estimators=[mle1, mle2, mle3], criterion=BIC(),
                                          n_optimizations=[5]*3)
     selector.sort_models()
@@ -45,16 +48,9 @@ def test_bic():
 
 
 def test_aicc():
-    data = Gamma(a=2, loc=0, scale=2).rvs(nsamples=500, random_state=12)
-    m0 = DistributionModel(distributions=Gamma(a=None, loc=None, scale=None), n_parameters=3, name='gamma')
-    m1 = DistributionModel(distributions=Exponential(loc=None, scale=None), n_parameters=2, name='exponential')
-    m2 = DistributionModel(distributions=ChiSquare(df=None, loc=None, scale=None),
-                           n_parameters=3, name='chi-square')
-
-    candidate_models = [m0, m1, m2]
-    mle1 = MLE(inference_model=m0, random_state=0, data=data)
-    mle2 = MLE(inference_model=m1, random_state=0, data=data)
-    mle3 = MLE(inference_model=m2, random_state=0, data=data)
+    mle1 = MLE(inference_model=m0, random_state=mle_random_state, data=data)
+    mle2 = MLE(inference_model=m1, random_state=mle_random_state, data=data)
+    mle3 = MLE(inference_model=m2, random_state=mle_random_state, data=data)
     selector = InformationModelSelection(parameter_estimators=[mle1, mle2, mle3], criterion=AICc(),
                                          n_optimizations=[5]*3)
 